@@ -39,6 +39,8 @@ class NuriConfig:
     detail_submissionid: str = "mf_wfm_container_selectBidPbancDetl"
 
     record_count_per_page: str = "10"
+    # 상세 조회 우선순위 큐에 미리 적재할 목록 페이지 수 (가장 앞의 미완료 페이지 기준)
+    priority_window_pages: int = 3
 
     # 공고 게시일: 오늘 기준 최근 30일
     pbanc_pstg_st_dt: str = ymd(TODAY - timedelta(days=30))
@@ -59,6 +61,10 @@ class NuriConfig:
 
     # 출력
     output_csv: str = "result.csv"
+    # NDJSON 스트리밍 대상 ("" 비활성, "-" stdout, "unix:<경로>" 유닉스 소켓, 그 외 파일 경로)
+    stream_ndjson: str = ""
+    stream_timeout_sec: float = 5.0
+    stream_retry_sec: float = 30.0
 
     # checkpoint
     checkpoint_dir: str = str(DEFAULT_CHECKPOINT_DIR)
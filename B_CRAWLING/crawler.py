@@ -1,8 +1,11 @@
 # B_CRAWLING/crawler.py
 import csv
+import heapq
 import logging
 import os
 import random
+import socket
+import sys
 import time
 import json
 from pathlib import Path
@@ -12,7 +15,7 @@ import pandas as pd
 
 from B_CRAWLING.config import NuriConfig
 from B_CRAWLING.http_client import NuriHttpClient
-from B_CRAWLING.mapper import BID_FULL_NO_COLUMN, build_bid_id, to_standard_record
+from B_CRAWLING.mapper import BID_FULL_NO_COLUMN, build_bid_id, deadline_key, to_standard_record
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +36,74 @@ class CsvWriter:
             writer.writerow(record)
 
 
+class NdjsonWriter:
+    def __init__(self, target: str, timeout_sec: float = 5.0, retry_sec: float = 30.0):
+        # 스트리밍 대상 설정 ("-" stdout, "unix:<경로>" 유닉스 소켓, 그 외 파일 경로)
+        if target.startswith("unix:") and not hasattr(socket, "AF_UNIX"):
+            raise ValueError(f"이 플랫폼은 유닉스 소켓을 지원하지 않습니다: {target}")
+        self.target = target
+        self.timeout_sec = timeout_sec
+        self.retry_sec = retry_sec
+        self._sock: Optional[socket.socket] = None
+        self._retry_at = 0.0
+
+    def _connect(self) -> socket.socket:
+        # 유닉스 소켓 연결을 최초 1회 생성 후 재사용 (소비자가 멈춰도 무한 대기하지 않도록 타임아웃 설정)
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout_sec)
+            try:
+                sock.connect(self.target[len("unix:"):])
+            except Exception:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def emit(self, record: dict):
+        # 레코드 1건을 JSON 한 줄로 즉시 내보냄 (실패해도 수집 흐름은 중단하지 않음)
+        now = time.monotonic()
+        if now < self._retry_at:
+            return
+        try:
+            line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            if self.target == "-":
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            elif self.target.startswith("unix:"):
+                self._connect().sendall(line.encode("utf-8"))
+            else:
+                with open(self.target, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except Exception as e:
+            # sendall 타임아웃 시 줄 일부만 전송됐을 수 있으므로 소켓을 닫아 연결을 끊음
+            # (잘린 줄은 항상 해당 연결의 마지막 데이터 → 소비자는 EOF 직전 개행 없는 줄을 버려야 함)
+            # 실패 시 retry_sec 동안 스트리밍을 건너뛰어 매 레코드마다 재연결/경고하지 않음
+            logger.warning("NDJSON 스트리밍 실패, %.0f초 후 재시도: %s", self.retry_sec, e)
+            self.close()
+            self._retry_at = now + self.retry_sec
+
+    def close(self):
+        # 열린 소켓이 있으면 정리 (다음 emit 시 재연결)
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
 class NuriBidCrawler:
     def __init__(self, cfg: NuriConfig):
         # 크롤러 기본 구성 요소 초기화 (설정, HTTP, CSV, 체크포인트)
         self.cfg = cfg
         self.http = NuriHttpClient(cfg)
         self.writer = CsvWriter(cfg.output_csv)
+        self.stream = (
+            NdjsonWriter(cfg.stream_ndjson, cfg.stream_timeout_sec, cfg.stream_retry_sec)
+            if cfg.stream_ndjson
+            else None
+        )
         self._ckpt_dir = Path(cfg.checkpoint_dir)
         self._ckpt_dir.mkdir(parents=True, exist_ok=True)
         self._ckpt_path = self._ckpt_dir / cfg.checkpoint_file
@@ -101,12 +166,22 @@ class NuriBidCrawler:
             page = default
         return max(1, page)
 
-    def _save_next_page(self, keyword: str, next_page: int) -> None:
-        # 키워드별 다음에 수집할 페이지 번호를 체크포인트에 저장
+    def _load_done_bids(self, keyword: str) -> set:
+        # 재개 페이지 이후에서 이미 처리한 bid 번호들을 체크포인트에서 조회
+        data = self._read_ckpt()
+        kw = (keyword or "").strip()
+        done = data["keywords"].get(kw, {}).get("done_bids", [])
+        if not isinstance(done, list):
+            return set()
+        return {str(v) for v in done if v}
+
+    def _save_next_page(self, keyword: str, next_page: int, done_bids: Optional[set] = None) -> None:
+        # 키워드별 다음에 수집할 페이지 번호(및 그 이후 페이지에서 처리 완료한 bid)를 체크포인트에 저장
         data = self._read_ckpt()
         kw = (keyword or "").strip()
         data["keywords"].setdefault(kw, {})
         data["keywords"][kw]["next_page"] = int(next_page)
+        data["keywords"][kw]["done_bids"] = sorted(done_bids or [])
         data["keywords"][kw]["updated_at"] = int(time.time())
         self._atomic_write_json(self._ckpt_path, data)
 
@@ -157,52 +232,96 @@ class NuriBidCrawler:
         else:
             page = start_page
 
-        saved_bids = self._load_saved_bid_set()
+        # CSV 끝부분의 bid + 체크포인트에 남은 처리 완료 bid로 중복 방지
+        # (우선순위 순서로 처리하므로 재개 페이지 이후에도 이미 처리한 행이 있을 수 있음)
+        resume_done_bids = self._load_done_bids(keyword)
+        saved_bids = self._load_saved_bid_set() | resume_done_bids
         pages_done = 0
         logger.info("키워드=%r, 시작 페이지=%d (재개 시 이어서 수집)", keyword or "(전체)", page)
 
+        # 목록 페이지를 priority_window_pages 만큼 앞서 조회해 하나의 우선순위 큐에 적재하고
+        # 마감/개찰 임박 순으로 상세 조회 (동일 시각은 페이지/목록 순서 유지)
+        # 가장 앞의 미완료 페이지로부터 window 범위 안에서만 다음 목록을 조회하므로
+        # 첫 레코드 출력과 체크포인트 지연이 모두 window 페이지 이내로 제한됨
+        window = max(1, int(self.cfg.priority_window_pages))
+        queue = []
+        pending: Dict[int, int] = {}
+        done_by_page: Dict[int, set] = {}
+        list_done = False
+
         while True:
-            if max_pages is not None and pages_done >= max_pages:
-                break
+            while not list_done and (not pending or page < min(pending) + window):
+                if max_pages is not None and pages_done >= max_pages:
+                    list_done = True
+                    break
 
-            try:
-                rows = self.http.fetch_list(page=page, keyword=keyword)
-            except Exception as e:
-                logger.warning("목록 조회 실패(page=%d). 재실행 시 이어서 수집 가능: %s", page, e)
-                self._save_next_page(keyword, page)
-                break
+                try:
+                    rows = self.http.fetch_list(page=page, keyword=keyword)
+                except Exception as e:
+                    logger.warning("목록 조회 실패(page=%d). 재실행 시 이어서 수집 가능: %s", page, e)
+                    list_done = True
+                    break
+
+                if not rows:
+                    list_done = True
+                    break
+
+                for idx, row in enumerate(rows):
+                    heapq.heappush(queue, (deadline_key(row), page, idx, row))
+                pending[page] = len(rows)
+                done_by_page[page] = set()
+                pages_done += 1
+                page += 1
 
-            if not rows:
-                self._save_next_page(keyword, page)
+                next_row_yn = rows[-1].get("nextRowYn")
+                if str(next_row_yn).upper() != "Y":
+                    list_done = True
+
+            if not queue:
+                # 조회된 행이 없으면 해당 페이지부터 재개 (행이 있었다면 마지막 페이지 완료 시 저장됨)
+                if pages_done == 0:
+                    self._save_next_page(keyword, page, resume_done_bids)
                 break
 
-            for row in rows:
+            _, row_page, _, row = heapq.heappop(queue)
+            row_bid = str(row.get("bidPbancFullNo") or "").strip()
+            if row_bid and row_bid in saved_bids:
+                # 이미 저장된 공고는 상세 조회 없이 건너뜀
+                done_by_page[row_page].add(row_bid)
+            else:
                 try:
                     detail = self.http.fetch_detail(row)
                     record = to_standard_record(row, detail)
                     bid_full = (record.get(BID_FULL_NO_COLUMN) or "").strip()
-                    if bid_full and bid_full in saved_bids:
-                        self._sleep_normal()
-                        continue
-                    self.writer.append(record)
-                    if bid_full:
-                        saved_bids.add(bid_full)
-                    collected += 1
+                    if not (bid_full and bid_full in saved_bids):
+                        self.writer.append(record)
+                        if bid_full:
+                            saved_bids.add(bid_full)
+                        collected += 1
+                        if self.stream is not None:
+                            self.stream.emit(record)
+                    if row_bid:
+                        saved_bids.add(row_bid)
+                        done_by_page[row_page].add(row_bid)
                 except Exception as e:
                     logger.debug("행 처리 스킵: %s", e)
                 finally:
                     self._sleep_normal()
 
-            pages_done += 1
-            logger.info("페이지 %d 완료, 이번 키워드 누적 %d건", page, collected)
-
-            next_row_yn = rows[-1].get("nextRowYn")
-            if str(next_row_yn).upper() != "Y":
-                self._save_next_page(keyword, page + 1)
-                break
+            pending[row_page] -= 1
+            if pending[row_page] == 0:
+                logger.info("페이지 %d 완료, 이번 키워드 누적 %d건", row_page, collected)
+            while pending and pending[min(pending)] == 0:
+                lowest = min(pending)
+                del pending[lowest]
+                del done_by_page[lowest]
 
-            self._save_next_page(keyword, page + 1)
-            page += 1
+            # 행마다 체크포인트 갱신: 가장 앞의 미완료 페이지 + 그 이후 페이지에서 처리 완료한 bid
+            self._save_next_page(
+                keyword,
+                min(pending) if pending else page,
+                set().union(*done_by_page.values()),
+            )
 
         logger.info("키워드=%r 수집 완료, 총 %d건", keyword or "(전체)", collected)
         return collected
@@ -66,10 +66,28 @@ def main():
         default="bids_export.xlsx",
         help="엑셀 내보내기 파일명",
     )
+    p.add_argument(
+        "--priority-window",
+        type=int,
+        default=3,
+        help="마감 임박 순 상세 조회를 위해 미리 조회할 목록 페이지 수",
+    )
+    p.add_argument(
+        "--stream",
+        default="",
+        help="수집 레코드 NDJSON 실시간 출력 대상 (\"-\": stdout, \"unix:<경로>\": 유닉스 소켓, 그 외: 파일 경로)",
+    )
     args = p.parse_args()
 
-    cfg = NuriConfig(cookie=args.cookie)
-    crawler = NuriBidCrawler(cfg)
+    cfg = NuriConfig(
+        cookie=args.cookie,
+        stream_ndjson=args.stream,
+        priority_window_pages=args.priority_window,
+    )
+    try:
+        crawler = NuriBidCrawler(cfg)
+    except ValueError as e:
+        p.error(str(e))
 
     if args.mode == "once":
         for kw in args.keyword:
@@ -1,9 +1,33 @@
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import html
 
 BID_FULL_NO_COLUMN = "입찰공고번호(Full)"
 
+# 목록 행에서 마감/개찰 임박도를 판단할 때 사용하는 일시 필드
+# (입찰서접수시작일시는 마감/개찰 시각이 아니므로 제외)
+DEADLINE_FIELDS = (
+    "slprRcptDdlnDt",
+    "bidQlfcRegDt",
+    "onbsPrnmntDt",
+)
+
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y%m%d%H%M%S",
+    "%Y%m%d%H%M",
+)
+
+# 시각 없이 날짜만 있는 포맷
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y%m%d",
+)
+
 
 def unescape_html(s):
     # HTML 이스케이프 문자열을 원문으로 복원
@@ -27,6 +51,41 @@ def safe_list(x: Any) -> list:
     return x if isinstance(x, list) else []
 
 
+def parse_datetime(v: Any, end_of_day: bool = False) -> Optional[datetime]:
+    # 누리장터 일시 문자열(여러 포맷)을 datetime으로 변환, 실패 시 None
+    # (날짜만 있는 값은 end_of_day=True이면 해당일 23:59:59, 아니면 00:00으로 해석)
+    if v is None:
+        return None
+    s = str(v).strip()
+    if not s:
+        return None
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    for fmt in DATE_FORMATS:
+        try:
+            d = datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+        return d.replace(hour=23, minute=59, second=59) if end_of_day else d
+    return None
+
+
+def deadline_key(row: Dict[str, Any], now: Optional[datetime] = None) -> datetime:
+    # 목록 행의 마감/개찰 일시 중 아직 지나지 않은 가장 이른 시각을 반환
+    # (일시 정보가 없거나 모두 지난 공고는 datetime.max로 가장 뒤로 보냄)
+    now = now or datetime.now()
+    upcoming = []
+    for field in DEADLINE_FIELDS:
+        # 날짜만 있는 마감일은 당일 자정까지 유효한 것으로 간주
+        dt = parse_datetime(pick(row.get(field + "Indt"), row.get(field)), end_of_day=True)
+        if dt is not None and dt >= now:
+            upcoming.append(dt)
+    return min(upcoming) if upcoming else datetime.max
+
+
 def pick(*vals: Any) -> Any:
     # 여러 후보 값 중 비어있지 않은 첫 번째 값을 선택
     for v in vals:
@@ -0,0 +1,186 @@
+import json
+import socket
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("requests")
+
+from B_CRAWLING.config import NuriConfig
+from B_CRAWLING import crawler as crawler_mod
+from B_CRAWLING.crawler import NdjsonWriter, NuriBidCrawler
+from B_CRAWLING.mapper import BID_FULL_NO_COLUMN
+
+
+class FakeHttp:
+    def __init__(self, pages):
+        self.pages = pages
+        self.detail_calls = []
+        self.events = []
+
+    def fetch_list(self, page, keyword=""):
+        self.events.append(("list", page))
+        return self.pages.get(page, [])
+
+    def fetch_detail(self, row):
+        self.detail_calls.append(row["bidPbancFullNo"])
+        self.events.append(("detail", row["bidPbancFullNo"]))
+        return {}
+
+
+def make_crawler(tmp_path, pages, **cfg_kwargs):
+    cfg = NuriConfig(
+        output_csv=str(tmp_path / "result.csv"),
+        checkpoint_dir=str(tmp_path / "ckpt"),
+        base_sleep_sec=0,
+        jitter_sec=(0, 0),
+        **cfg_kwargs,
+    )
+    crawler = NuriBidCrawler(cfg)
+    crawler.http = FakeHttp(pages)
+    return crawler
+
+
+def row(bid, next_row_yn="Y", **dates):
+    return {"bidPbancFullNo": bid, "bidPbancNm": bid, "nextRowYn": next_row_yn, **dates}
+
+
+def test_ndjson_writer_file_one_json_line_per_record(tmp_path):
+    path = tmp_path / "out.ndjson"
+    writer = NdjsonWriter(str(path))
+    records = [{BID_FULL_NO_COLUMN: "A", "용역건수": 1}, {BID_FULL_NO_COLUMN: "B", "배정예산": None}]
+    for rec in records:
+        writer.emit(rec)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == records
+
+
+def test_ndjson_writer_unreachable_socket_warns_once(tmp_path, caplog):
+    writer = NdjsonWriter("unix:" + str(tmp_path / "missing.sock"), retry_sec=60)
+    with caplog.at_level("WARNING"):
+        writer.emit({"a": 1})
+        writer.emit({"a": 2})
+    assert len(caplog.records) == 1
+
+
+class FakeSocket:
+    def __init__(self, fail_after=None):
+        self.data = b""
+        self.closed = False
+        self.fail_after = fail_after
+
+    def settimeout(self, t):
+        pass
+
+    def connect(self, path):
+        pass
+
+    def sendall(self, b):
+        if self.fail_after is not None:
+            self.data += b[: self.fail_after]
+            raise socket.timeout("timed out")
+        self.data += b
+
+    def close(self):
+        self.closed = True
+
+
+def test_ndjson_writer_socket_timeout_ends_connection_on_partial_line(monkeypatch):
+    socks = [FakeSocket(fail_after=5), FakeSocket()]
+    monkeypatch.setattr(crawler_mod.socket, "socket", lambda *a: socks.pop(0))
+    writer = NdjsonWriter("unix:/tmp/consumer.sock", retry_sec=0)
+    first, second = socks
+
+    writer.emit({"a": 1})
+    # 잘린 줄은 개행 없이 연결의 마지막 데이터로 남고, 연결은 닫힘
+    assert first.closed
+    assert first.data and not first.data.endswith(b"\n")
+
+    writer.emit({"a": 2})
+    # 재연결 후에는 완전한 줄로 시작
+    assert [json.loads(line) for line in second.data.decode("utf-8").splitlines()] == [{"a": 2}]
+    assert second.data.endswith(b"\n")
+
+
+def test_crawl_once_orders_details_across_pages(tmp_path):
+    pages = {
+        1: [row("P1-none"), row("P1-late", onbsPrnmntDt="2099/03/01 10:00")],
+        2: [row("P2-urgent", "N", slprRcptDdlnDt="2098-01-01 10:00:00"), row("P2-none", "N")],
+    }
+    crawler = make_crawler(tmp_path, pages)
+
+    assert crawler.crawl_once("") == 4
+    # 동일 키(일시 없음)는 페이지/목록 순서 유지
+    assert crawler.http.detail_calls == ["P2-urgent", "P1-late", "P1-none", "P2-none"]
+    assert crawler._load_start_page("") == 3
+
+
+def test_crawl_once_checkpoint_waits_for_lowest_unfinished_page(tmp_path):
+    pages = {
+        1: [row("P1-none")],
+        2: [row("P2-urgent", slprRcptDdlnDt="2098-01-01 10:00:00")],
+    }
+    crawler = make_crawler(tmp_path, pages)
+    saved = []
+    crawler._save_next_page = lambda kw, next_page, done_bids=None: saved.append(
+        (next_page, sorted(done_bids or []))
+    )
+
+    crawler.crawl_once("", max_pages=2)
+    # 2페이지가 먼저 끝나도 1페이지가 남아 있으면 체크포인트는 전진하지 않고 완료 bid만 기록
+    assert saved == [(1, ["P2-urgent"]), (3, [])]
+
+
+def test_crawl_once_starts_details_within_priority_window(tmp_path):
+    pages = {p: [row(f"P{p}-{i}") for i in range(2)] for p in range(1, 10)}
+    pages[10] = [row("P10-0", "N")]
+    crawler = make_crawler(tmp_path, pages, priority_window_pages=2)
+
+    assert crawler.crawl_once("") == 19
+    events = crawler.http.events
+    first_detail = next(i for i, e in enumerate(events) if e[0] == "detail")
+    # 상세 조회는 window(2) 페이지만 조회한 뒤 시작되고, 마지막 목록 페이지보다 먼저 실행됨
+    assert events[:first_detail] == [("list", 1), ("list", 2)]
+    assert first_detail < events.index(("list", 10))
+    assert crawler._load_start_page("") == 11
+
+
+def test_crawl_once_resume_skips_rows_done_before_interrupt(tmp_path, monkeypatch):
+    pages = {
+        1: [row("P1-none"), row("P1-late", onbsPrnmntDt="2099/03/01 10:00")],
+        2: [row("P2-urgent", slprRcptDdlnDt="2098-01-01 10:00:00"), row("P2-none", "N")],
+    }
+    stream = tmp_path / "out.ndjson"
+    # CSV tail 범위 밖으로 밀려난 경우를 가정해 CSV 기반 중복 방지는 비활성화
+    monkeypatch.setattr(NuriBidCrawler, "_load_saved_bid_set", lambda self: set())
+
+    first = make_crawler(tmp_path, pages, stream_ndjson=str(stream))
+    fetch_detail = first.http.fetch_detail
+
+    def interrupt_on_third(row):
+        if len(first.http.detail_calls) == 2:
+            raise KeyboardInterrupt
+        return fetch_detail(row)
+
+    first.http.fetch_detail = interrupt_on_third
+    with pytest.raises(KeyboardInterrupt):
+        first.crawl_once("")
+    assert first.http.detail_calls == ["P2-urgent", "P1-late"]
+
+    second = make_crawler(tmp_path, pages, stream_ndjson=str(stream))
+    second.crawl_once("")
+    assert second.http.detail_calls == ["P1-none", "P2-none"]
+
+    bids = [json.loads(line)[BID_FULL_NO_COLUMN] for line in stream.read_text(encoding="utf-8").splitlines()]
+    assert sorted(bids) == ["P1-late", "P1-none", "P2-none", "P2-urgent"]
+    assert second._load_start_page("") == 3
+
+
+def test_crawl_once_list_failure_keeps_done_bids(tmp_path):
+    crawler = make_crawler(tmp_path, {})
+    crawler._save_next_page("", 2, {"P2-urgent"})
+
+    assert crawler.crawl_once("") == 0
+    assert crawler._load_start_page("") == 2
+    assert crawler._load_done_bids("") == {"P2-urgent"}
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from B_CRAWLING.mapper import deadline_key, parse_datetime
+
+NOW = datetime(2026, 2, 15, 12, 0)
+
+
+def test_parse_datetime_formats_in_result_csv():
+    assert parse_datetime("2026-02-10 10:00:00") == datetime(2026, 2, 10, 10, 0, 0)
+    assert parse_datetime("2026/02/20 13:00") == datetime(2026, 2, 20, 13, 0)
+
+
+def test_parse_datetime_empty_or_invalid():
+    assert parse_datetime(None) is None
+    assert parse_datetime("") is None
+    assert parse_datetime("   ") is None
+    assert parse_datetime("공고서참조") is None
+
+
+def test_deadline_key_uses_earliest_upcoming_deadline():
+    row = {"slprRcptDdlnDt": "2026-02-20 11:00:00", "onbsPrnmntDt": "2026/02/20 13:00"}
+    assert deadline_key(row, NOW) == datetime(2026, 2, 20, 11, 0)
+
+
+def test_deadline_key_ignores_receipt_start():
+    row = {"slprRcptBgngDt": "2026-02-16 09:00:00", "slprRcptDdlnDt": "2026-02-20 11:00:00"}
+    assert deadline_key(row, NOW) == datetime(2026, 2, 20, 11, 0)
+
+
+def test_deadline_key_past_and_empty_sort_last():
+    past = {"slprRcptDdlnDt": "2026-02-10 10:00:00"}
+    empty = {"slprRcptDdlnDt": "", "onbsPrnmntDt": None}
+    upcoming = {"onbsPrnmntDt": "2026/03/01 10:00"}
+    assert deadline_key(past, NOW) == datetime.max
+    assert deadline_key(empty, NOW) == datetime.max
+    assert deadline_key(upcoming, NOW) < deadline_key(past, NOW)
+
+
+def test_parse_datetime_date_only():
+    assert parse_datetime("2026-02-20") == datetime(2026, 2, 20)
+    assert parse_datetime("20260220", end_of_day=True) == datetime(2026, 2, 20, 23, 59, 59)
+
+
+def test_deadline_key_date_only_is_due_until_end_of_day():
+    row = {"slprRcptDdlnDt": "2026-02-15"}
+    assert deadline_key(row, NOW) == datetime(2026, 2, 15, 23, 59, 59)